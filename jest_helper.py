@@ -10,9 +10,22 @@
 
 import os
 import subprocess
+import sys
+import signal
+import stat
+import threading
+import time
 import json
 import re
-import copy
+import functools
+import heapq
+import concurrent.futures
+import collections
+import itertools
+import mmap
+import tempfile
+import types
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
 from mcp.server.fastmcp import FastMCP
 
@@ -21,6 +34,80 @@ from mcp.server.fastmcp import FastMCP
 # ------------------------------------------------------------
 MAX_FILE_SIZE = 1024 * 1024  # 1MB max file read
 MAX_OUTPUT_LINES = 500       # Truncate large outputs
+_RUN_TIMEOUT_SECONDS = 120   # Kill a Jest run after 2 minutes
+_IMPORT_SCAN_LINES = 40      # Give up looking for an import block after this
+_NAMING_EXAMPLES = 4         # describe()/it() names shown in the analysis report
+_ANALYZE_READ_LIMIT = 256 * 1024  # Characters of each test file analyzed by default
+_ANALYZE_MIN_FILES = 2       # Files analyzed before the sample may stop early
+
+# ------------------------------------------------------------
+# PRECOMPILED PATTERNS
+#
+# Compiled once at import so the analysis tools don't pay a
+# pattern-cache lookup for every regex call on every file.
+# ------------------------------------------------------------
+_RE_AAA = re.compile(r'//\s*(Arrange|Act|Assert)')
+_RE_DESCRIBE_NAME = re.compile(r"describe\s*\(\s*['\"]([^'\"]+)['\"]")
+_RE_IT_NAME = re.compile(r"it\s*\(\s*['\"]([^'\"]+)['\"]")
+_RE_TEST_NAME = re.compile(r"test\s*\(\s*['\"]([^'\"]+)['\"]")
+_RE_DESCRIBE_BLOCK = re.compile(
+    r"(describe\s*\(['\"][^'\"]+['\"],\s*\(\)\s*=>\s*\{[\s\S]*?^\}\);)",
+    re.MULTILINE
+)
+_RE_IT_BLOCK = re.compile(
+    r"(it\s*\(['\"][^'\"]+['\"],\s*(?:async\s*)?\(\)\s*=>\s*\{[\s\S]*?^\s*\}\);)",
+    re.MULTILINE
+)
+# Test-file classifier: the write tools' safety gate and source-name stripping
+_RE_TEST_SUFFIX = re.compile(r'\.(test|spec)\.(tsx?|jsx?)$')
+
+# (substring, analysis key, label) probes run against each sampled test
+# file. A probe is skipped once its label has been recorded, so later files
+# only pay for features that haven't been seen yet.
+_FEATURE_PROBES = (
+    ("@testing-library/react", "import_patterns", "@testing-library/react"),
+    ("@testing-library/user-event", "import_patterns", "@testing-library/user-event"),
+    ("@testing-library/jest-dom", "import_patterns", "@testing-library/jest-dom"),
+    ("render", "common_utilities", "render"),
+    ("screen", "common_utilities", "screen"),
+    ("fireEvent", "common_utilities", "fireEvent"),
+    ("userEvent", "common_utilities", "userEvent"),
+    ("waitFor", "common_utilities", "waitFor"),
+    ("act", "common_utilities", "act"),
+    ("within", "common_utilities", "within"),
+    ("jest.mock(", "mocking_patterns", "jest.mock() - module mocking"),
+    ("jest.fn()", "mocking_patterns", "jest.fn() - function mocks"),
+    ("jest.spyOn(", "mocking_patterns", "jest.spyOn() - spy on methods"),
+    ("mockImplementation", "mocking_patterns", "mockImplementation()"),
+    ("mockResolvedValue", "mocking_patterns", "mockResolvedValue() - async mocks"),
+    ("mockReturnValue", "mocking_patterns", "mockReturnValue()"),
+    ("toBeInTheDocument", "assertion_patterns", "toBeInTheDocument()"),
+    ("toHaveBeenCalled", "assertion_patterns", "toHaveBeenCalled()"),
+    ("toHaveBeenCalledWith", "assertion_patterns", "toHaveBeenCalledWith()"),
+    ("toEqual", "assertion_patterns", "toEqual()"),
+    ("toBe(", "assertion_patterns", "toBe()"),
+    ("toMatchSnapshot", "assertion_patterns", "toMatchSnapshot()"),
+    ("toThrow", "assertion_patterns", "toThrow()"),
+)
+
+# ------------------------------------------------------------
+# REPORT BOX CONSTANTS
+# ------------------------------------------------------------
+_BOX_H60 = "═" * 60
+_BOX_H64 = "═" * 64
+_PAD34 = " " * 34
+
+# ------------------------------------------------------------
+# FILE DISCOVERY CONSTANTS
+# ------------------------------------------------------------
+_TEST_SUFFIXES = (
+    ".test.ts", ".test.tsx", ".test.js", ".test.jsx",
+    ".spec.ts", ".spec.tsx", ".spec.js", ".spec.jsx",
+)
+_DOT_TEST_SUFFIXES = _TEST_SUFFIXES[:4]
+_SKIP_DIRS = frozenset({"node_modules", ".git", "__pycache__", ".venv"})
+# Build output can contain copied test files; never use those as examples
+_EXAMPLE_SKIP_DIRS = _SKIP_DIRS | {"dist", "build", ".next"}
 
 # ------------------------------------------------------------
 # INITIALIZE MCP SERVER
@@ -37,7 +124,39 @@ mcp = FastMCP("jest-helper")
 # ------------------------------------------------------------
 def get_project_root() -> str:
     """Get the project root from environment variable or current directory."""
-    return os.environ.get("PROJECT_ROOT", os.getcwd())
+    return _project_root_for(os.environ.get("PROJECT_ROOT"))[0]
+
+
+def _project_root_path() -> Path:
+    """The resolved project root, built once per PROJECT_ROOT value."""
+    return _project_root_for(os.environ.get("PROJECT_ROOT"))[1]
+
+
+def _project_root_str() -> str:
+    """The resolved project root as a string."""
+    return _project_root_for(os.environ.get("PROJECT_ROOT"))[2]
+
+
+def _project_root_prefix() -> str:
+    """The resolved project root with a trailing separator, for prefix checks."""
+    return _project_root_for(os.environ.get("PROJECT_ROOT"))[3]
+
+
+@functools.lru_cache(maxsize=4)
+def _project_root_for(env_root: str | None) -> tuple[str, Path, str, str]:
+    """
+    Return (root, resolved root, resolved str, resolved str + sep) for a
+    PROJECT_ROOT value.
+
+    Keyed on the environment value, so resolve() (and the getcwd() fallback)
+    run once per distinct PROJECT_ROOT rather than on every tool call, while
+    a changed PROJECT_ROOT is still picked up.
+    """
+    root = env_root if env_root is not None else os.getcwd()
+    resolved = Path(root).resolve()
+    resolved_str = str(resolved)
+    prefix = resolved_str if resolved_str.endswith(os.sep) else resolved_str + os.sep
+    return root, resolved, resolved_str, prefix
 
 
 def _validate_path_security(file_path: str) -> tuple[Path, str | None]:
@@ -47,54 +166,126 @@ def _validate_path_security(file_path: str) -> tuple[Path, str | None]:
     Returns:
         tuple: (resolved_path, error_message or None if valid)
     """
-    project_root = Path(get_project_root()).resolve()
+    full, inside = _resolve_in_root(file_path, _project_root_str(), _project_root_prefix())
+    if inside:
+        return Path(full), None
+    return Path(full), "⛔ Security: Cannot access files outside project directory"
 
-    if os.path.isabs(file_path):
-        full_path = Path(file_path).resolve()
-    else:
-        full_path = (project_root / file_path).resolve()
 
-    try:
-        full_path.relative_to(project_root)
-        return full_path, None
-    except ValueError:
-        return full_path, "⛔ Security: Cannot access files outside project directory"
+def _resolve_in_root(file_path: str, root: str, prefix: str) -> tuple[str, bool]:
+    """
+    Resolve file_path against root; return (resolved path, inside root?).
+
+    prefix is root with a trailing separator, for the containment check.
+    Deliberately not cached: a directory swapped for a symlink must be
+    caught on the very next call.
+    """
+    joined = os.path.join(root, file_path)
+
+    # A relative path that climbs out of the root with '..' is rejected
+    # lexically, before any filesystem access. (Absolute paths skip this:
+    # they may legitimately reach the root through a symlinked prefix.)
+    if not os.path.isabs(file_path):
+        norm = os.path.normpath(joined)
+        if norm != root and not norm.startswith(prefix):
+            return norm, False
+
+    # realpath (not just normpath) so symlinks pointing outside are caught;
+    # the containment check itself is a plain string prefix test.
+    full = os.path.realpath(joined)
+    return full, full == root or full.startswith(prefix)
 
 
 def _truncate_output(content: str, max_lines: int = MAX_OUTPUT_LINES) -> str:
     """
     Truncate large outputs showing head + tail with count of skipped lines.
     """
-    lines = content.split('\n')
-    if len(lines) <= max_lines:
+    total = content.count('\n') + 1
+    if total <= max_lines:
         return content
 
     half = max_lines // 2
-    head = lines[:half]
-    tail = lines[-half:]
-    skipped = len(lines) - max_lines
-
-    return '\n'.join(head + [f"\n... ⚡ [{skipped} lines truncated for performance] ...\n"] + tail)
+    skipped = total - max_lines
+    parts = []
+    tail = content
+
+    # Slice at the half-th newline from each end instead of splitting every line
+    if half > 0:
+        head_end = -1
+        for _ in range(half):
+            head_end = content.find('\n', head_end + 1)
+        parts.append(content[:head_end])
+
+        tail_start = len(content)
+        for _ in range(half):
+            tail_start = content.rfind('\n', 0, tail_start)
+        tail = content[tail_start + 1:]
+
+    parts.append(f"\n... ⚡ [{skipped} lines truncated for performance] ...\n")
+    parts.append(tail)
+    return '\n'.join(parts)
+
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Lazily yield the '\n'-separated lines of content without splitting it all."""
+    start = 0
+    while True:
+        end = content.find('\n', start)
+        if end == -1:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+_BOX_CHARS = {
+    # tl, tr, mid-left, mid-right, bl, br, horizontal, vertical
+    "double": ("╔", "╗", "╠", "╣", "╚", "╝", "═", "║"),
+    "single": ("┌", "┐", "├", "┤", "└", "┘", "─", "│"),
+}
 
 
 def _format_box(title: str, content_lines: list[str], style: str = "double") -> str:
     """Format content in a visual box for CLI output."""
-    if style == "double":
-        tl, tr, bl, br, h, v = "╔", "╗", "╚", "╝", "═", "║"
-    else:
-        tl, tr, bl, br, h, v = "┌", "┐", "└", "┘", "─", "│"
+    tl, tr, ml, mr, bl, br, h, v = _BOX_CHARS["double" if style == "double" else "single"]
 
-    width = max(len(title) + 4, max((len(line) for line in content_lines), default=40) + 4, 60)
+    width = max(len(title) + 4, max(map(len, content_lines), default=40) + 4, 60)
+    inner = width - 4
+    rule = h * (width - 2)
 
-    result = [f"{tl}{h * (width - 2)}{tr}"]
-    result.append(f"{v}  {title:<{width - 4}}{v}")
-    result.append(f"{tl}{h * (width - 2)}{tr}".replace(tl, "╠").replace(tr, "╣") if style == "double" else f"├{h * (width - 2)}┤")
+    result = [f"{tl}{rule}{tr}", f"{v}  {title.ljust(inner)}{v}", f"{ml}{rule}{mr}"]
+    result.extend(f"{v}  {line.ljust(inner)}{v}" for line in content_lines)
+    result.append(f"{bl}{rule}{br}")
+    return '\n'.join(result)
 
-    for line in content_lines:
-        result.append(f"{v}  {line:<{width - 4}}{v}")
 
-    result.append(f"{bl}{h * (width - 2)}{br}")
-    return '\n'.join(result)
+def _iter_test_files(
+    root: Path,
+    suffixes: tuple[str, ...] = _TEST_SUFFIXES,
+    base: Path | None = None,
+    skip_dirs: frozenset[str] = _SKIP_DIRS,
+) -> Iterator[tuple[str, str]]:
+    """
+    Walk the tree once, yielding test files that end with one of `suffixes`.
+
+    Dependency and tooling directories (`skip_dirs`: node_modules, .git, ...)
+    are pruned before descent instead of being walked and filtered out
+    afterwards.
+
+    Yields:
+        (path relative to `base` (defaults to `root`), absolute path) strings.
+        The relative directory is computed once per directory, not per file.
+    """
+    base = root if base is None else base
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+        rel_dir = None
+        for name in filenames:
+            if name.endswith(suffixes):
+                if rel_dir is None:
+                    rel_dir = os.path.relpath(dirpath, base)
+                relative = name if rel_dir == os.curdir else os.path.join(rel_dir, name)
+                yield relative, os.path.join(dirpath, name)
 
 
 # Default configuration - used when no .jest-helper.json exists
@@ -238,38 +429,391 @@ describe('apiFunction', () => {
 });'''
     },
     "validation_rules": [
-        {"id": "has_describe", "description": "Test must use describe() blocks", "pattern": r"describe\s*\("},
-        {"id": "has_it_or_test", "description": "Test must use it() or test()", "pattern": r"(it|test)\s*\("},
+        {"id": "has_describe", "description": "Test must use describe() blocks", "pattern": r"describe\s*\(", "flags": ["multiline"]},
+        {"id": "has_it_or_test", "description": "Test must use it() or test()", "pattern": r"(it|test)\s*\(", "flags": ["multiline"]},
         {"id": "it_uses_should", "description": "it() should start with 'should'", "pattern": r"it\s*\(\s*['\"]should", "warning": True},
-        {"id": "has_assertions", "description": "Test must have assertions", "pattern": r"expect\s*\("},
+        {"id": "has_assertions", "description": "Test must have assertions", "pattern": r"expect\s*\(", "flags": ["multiline"]},
         {"id": "has_aaa_comments", "description": "Test should have AAA comments (optional)", "pattern": r"//\s*(Arrange|Act|Assert)", "warning": True},
-        {"id": "no_only", "description": "No .only() or .skip() in tests", "pattern": r"\.(only|skip)\s*\(", "must_not_match": True},
-        {"id": "has_edge_cases", "description": "Should test edge cases", "pattern": r"(null|undefined|empty|error)", "warning": True}
+        {"id": "no_only", "description": "No .only() or .skip() in tests", "pattern": r"\.(only|skip)\s*\(", "flags": ["multiline"], "prefilter": [".only", ".skip"], "must_not_match": True},
+        {"id": "has_edge_cases", "description": "Should test edge cases", "pattern": r"(null|undefined|empty|error)", "prefilter": ["null", "undefined", "empty", "error"], "warning": True}
     ]
 }
 
 
-def load_config() -> dict:
-    """Load configuration from .jest-helper.json or use defaults."""
-    project_root = get_project_root()
-    config_path = Path(project_root) / ".jest-helper.json"
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
 
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
-            # Deep copy to prevent mutation of DEFAULT_CONFIG
-            merged = copy.deepcopy(DEFAULT_CONFIG)
-            for key in user_config:
-                if isinstance(user_config[key], dict) and key in merged:
-                    merged[key] = {**merged[key], **user_config[key]}
-                else:
-                    merged[key] = user_config[key]
-            return merged
-        except (json.JSONDecodeError, IOError):
-            pass
 
-    return copy.deepcopy(DEFAULT_CONFIG)
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Return True if pattern has a '|' outside any group or character class."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _required_literal(pattern: str, fold: bool = True) -> str:
+    """
+    Return a literal that every match of pattern must contain, case-folded
+    unless fold is False (for rules compiled without re.IGNORECASE).
+
+    Only the plain-text run at the very start of the pattern is considered
+    (e.g. "describe" for ``describe\\s*\\(``); anything else, including a
+    top-level alternation, yields "" (no prefilter).
+    """
+    if _has_top_level_alternation(pattern):
+        return ""
+    chars = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if not escaped or escaped.isalnum():
+                break
+            chars.append(escaped)
+            i += 2
+        elif c in _REGEX_METACHARS:
+            break
+        else:
+            chars.append(c)
+            i += 1
+    # A quantifier makes the preceding character optional/repeatable
+    if chars and pattern[i:i + 1] in ("?", "*", "+", "{"):
+        chars.pop()
+    literal = "".join(chars)
+    if fold:
+        literal = literal.casefold()
+    return literal if len(literal) >= 2 and literal.isascii() else ""
+
+
+def _fold_case(content: str) -> str:
+    """
+    Case-fold content for literal prefilters of re.IGNORECASE rules.
+
+    casefold() maps every character re.IGNORECASE equates with an ASCII
+    character to that character's fold, except two (checked over all code
+    points): U+0130 'İ', which casefolds to 'i' + U+0307, and U+0131 'ı',
+    which is left alone. Both are mapped to 'i' explicitly so an ASCII
+    literal prefilter never rejects text the regex would match.
+    """
+    if "İ" in content:
+        content = content.replace("İ", "i")
+    folded = content.casefold()
+    if "ı" in folded:
+        folded = folded.replace("ı", "i")
+    return folded
+
+
+# Names accepted in a validation rule's "flags" list
+_RULE_FLAGS = {"multiline": re.MULTILINE, "ignorecase": re.IGNORECASE, "dotall": re.DOTALL}
+_DEFAULT_RULE_FLAGS = ("multiline", "ignorecase")
+
+
+def _rule_flags(rule: dict) -> int:
+    """
+    Combine a rule's "flags" names into re flags (default: multiline + ignorecase).
+
+    Raises:
+        ValueError: If "flags" is not a list of known flag names.
+    """
+    names = rule.get("flags", _DEFAULT_RULE_FLAGS)
+    if isinstance(names, str) or not isinstance(names, (list, tuple)):
+        raise ValueError(f"flags must be a list of {', '.join(_RULE_FLAGS)}")
+    flags = 0
+    for name in names:
+        if name not in _RULE_FLAGS:
+            raise ValueError(f"unknown flag {name!r} (expected one of {', '.join(_RULE_FLAGS)})")
+        flags |= _RULE_FLAGS[name]
+    return flags
+
+
+def _rule_prefilter(rule: dict, pattern: str, ignorecase: bool) -> tuple[str, ...]:
+    """
+    Return the literals of which every match must contain at least one.
+
+    Taken from the rule's "prefilter" (a string or list of strings) when
+    given, else derived from the pattern (see _required_literal); () means
+    no prefilter. Literals of re.IGNORECASE rules are case-folded.
+
+    Raises:
+        ValueError: If "prefilter" is not a non-empty string or list of them.
+    """
+    prefilter = rule.get("prefilter")
+    if prefilter is None:
+        literal = _required_literal(pattern, fold=ignorecase)
+        return (literal,) if literal else ()
+    if isinstance(prefilter, str):
+        prefilter = [prefilter]
+    if (
+        not isinstance(prefilter, list)
+        or not prefilter
+        or not all(isinstance(literal, str) and literal for literal in prefilter)
+    ):
+        raise ValueError("prefilter must be a non-empty string or list of strings")
+    return tuple(_fold_case(literal) if ignorecase else literal for literal in prefilter)
+
+
+def _compile_rules(rules: list) -> list:
+    """
+    Return copies of the validation rules with their pattern precompiled.
+
+    Each rule dict gets a private "_compiled" entry holding the compiled
+    pattern, or None (with the reason in "_compile_error" and the offending
+    key in "_invalid_field") if the pattern or its "flags"/"prefilter" are
+    invalid, so the validators never
+    compile a rule per call, and a "_literals" entry (see _rule_prefilter)
+    used to skip the regex when the file can't possibly match. ASCII patterns
+    also get "_compiled_bytes"/"_literals_bytes" for matching ASCII files
+    without decoding them. "_on_match"/"_on_miss" hold the rule's status for
+    each outcome, from must_not_match and warning. Entries that aren't
+    objects become placeholders with "_invalid_field" set to "rule".
+    """
+    compiled_rules = []
+    for rule in rules:
+        if isinstance(rule, dict):
+            pattern = rule.get("pattern", "")
+            compile_error = None
+            invalid_field = None
+            flags = 0
+            literals = ()
+            # Checked field by field so a SKIP names the key to fix
+            try:
+                invalid_field = "flags"
+                flags = _rule_flags(rule)
+                invalid_field = "pattern"
+                compiled = re.compile(pattern, flags)
+                invalid_field = "prefilter"
+                literals = _rule_prefilter(rule, pattern, bool(flags & re.IGNORECASE))
+                invalid_field = None
+            except (re.error, TypeError, ValueError) as e:
+                compiled = None
+                compile_error = str(e)
+            compiled_bytes = None
+            if compiled is not None and pattern.isascii():
+                try:
+                    compiled_bytes = re.compile(pattern.encode("ascii"), flags)
+                except re.error:
+                    # str-only syntax (\uXXXX, \N{...}, (?u)): match as str
+                    pass
+            rule = {
+                **rule,
+                "_compiled": compiled,
+                "_ignorecase": bool(flags & re.IGNORECASE),
+                "_literals": literals,
+                "_compiled_bytes": compiled_bytes,
+                # Non-ASCII literals never occur in ASCII content, as intended
+                "_literals_bytes": tuple(literal.encode("utf-8") for literal in literals),
+                "_compile_error": compile_error,
+                "_invalid_field": invalid_field,
+                # Verdicts decided once here rather than per validation
+                "_on_match": "FAIL" if rule.get("must_not_match", False) else "PASS",
+                "_on_miss": (
+                    "PASS" if rule.get("must_not_match", False)
+                    else "WARN" if rule.get("warning", False)
+                    else "FAIL"
+                ),
+            }
+        else:
+            # Not a rule object: kept as a placeholder reported as SKIP
+            rule = {
+                "id": f"#{len(compiled_rules) + 1}",
+                "_compiled": None,
+                "_compile_error": f"expected an object, got {type(rule).__name__}",
+                "_invalid_field": "rule",
+            }
+        compiled_rules.append(rule)
+    return compiled_rules
+
+
+def _rule_matches(rule: dict, content: str | bytes, folded: str | bytes) -> bool:
+    """
+    Search content with a compiled rule, skipping the regex if none of its
+    prefilter literals is present.
+
+    content/folded are bytes only for ASCII files (see _read_for_rules). The
+    literals are looked up in folded for re.IGNORECASE rules, else in content.
+    """
+    if isinstance(content, bytes):
+        literals, compiled = rule["_literals_bytes"], rule["_compiled_bytes"]
+        if compiled is None:
+            # Non-ASCII pattern: fall back to str matching
+            literals, compiled = rule["_literals"], rule["_compiled"]
+            content, folded = content.decode("ascii"), folded.decode("ascii")
+    else:
+        literals, compiled = rule["_literals"], rule["_compiled"]
+    if literals:
+        haystack = folded if rule["_ignorecase"] else content
+        if not any(literal in haystack for literal in literals):
+            return False
+    return bool(compiled.search(content))
+
+
+# Line prefixes per rule status: validation report rows and rewrite issues
+_RULE_RESULT_PREFIXES = {
+    "PASS": "│ ✅ PASS   ",
+    "FAIL": "│ ❌ FAIL   ",
+    "WARN": "│ ⚠️  WARN   ",
+    "SKIP": "│ ⚠️  SKIP   ",
+}
+# How a SKIP row names the rule field that failed validation
+_INVALID_FIELD_LABELS = {"rule": "Invalid rule", "pattern": "Invalid regex", "flags": "Invalid flags", "prefilter": "Invalid prefilter"}
+_RULE_ISSUE_PREFIXES = {"FAIL": "❌ ", "WARN": "⚠️ "}
+
+
+def _evaluate_rules(rules: list[dict], content: str | bytes, folded: str | bytes) -> list[tuple[str, dict]]:
+    """
+    Run each validation rule once against content.
+
+    Shared by validate_test_style and rewrite_test_to_standard so both
+    report the same verdicts from a single pass over the rules.
+
+    Args:
+        rules: Compiled validation rules (see _compile_rules)
+        content: File content, as str or ASCII bytes
+        folded: The same content case-folded (see _rule_matches)
+
+    Returns:
+        (status, rule) pairs, status being "PASS", "FAIL", "WARN" or
+        "SKIP" (invalid rule). Rules without a pattern are left out.
+    """
+    results = []
+    for rule in rules:
+        if rule.get("_compile_error"):
+            results.append(("SKIP", rule))
+            continue
+        if not rule.get("pattern", ""):
+            continue
+        if _rule_matches(rule, content, folded):
+            results.append((rule["_on_match"], rule))
+        else:
+            results.append((rule["_on_miss"], rule))
+    return results
+
+
+# Read-only view handed out when no (valid) .jest-helper.json exists.
+# Nested dicts are shared with DEFAULT_CONFIG, so callers must not mutate them.
+_FROZEN_DEFAULT = types.MappingProxyType({
+    **DEFAULT_CONFIG,
+    "validation_rules": _compile_rules(DEFAULT_CONFIG["validation_rules"]),
+})
+
+# DEFAULT_CONFIG sections that a user config extends instead of replacing
+_NESTED_KEYS = frozenset(key for key, value in DEFAULT_CONFIG.items() if isinstance(value, dict))
+
+# Parsed config files keyed by path -> ((mtime_ns, size), value)
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], Mapping]] = {}
+# Config paths known to be missing, with the monotonic time to look again
+_CONFIG_MISSING: dict[str, float] = {}
+_CONFIG_MISSING_TTL = 2.0
+_JEST_CONFIG_CACHE: dict[str, tuple[tuple[int, int], str | None]] = {}
+
+
+def _mtime_cached(cache: dict, path: Path, build: Callable[[Path], object]):
+    """
+    Return build(path), re-running it only when the file's mtime or size changes.
+
+    Raises FileNotFoundError (or other OSError) if the file can't be stat'ed.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    hit = cache.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    value = build(path)
+    cache[key] = (stamp, value)
+    return value
+
+
+def _parse_config(config_path: Path) -> Mapping:
+    """
+    Parse .jest-helper.json and merge it over DEFAULT_CONFIG.
+
+    Top-level keys are overridden as-is; only the nested dict sections are
+    merged key-by-key. Unchanged values are shared with DEFAULT_CONFIG rather
+    than copied, in line with load_config's read-only contract.
+    """
+    # Bytes in: json detects the UTF-8/16/32 encoding itself instead of
+    # going through a locale-dependent text decoder.
+    with open(config_path, 'rb') as f:
+        user_config = json.loads(f.read())
+    if not isinstance(user_config, dict):
+        # Reported once per config version; the defaults apply instead
+        print(
+            f"⚠️ {config_path}: top level must be an object, "
+            f"got {type(user_config).__name__}; using the defaults",
+            file=sys.stderr,
+        )
+        return _FROZEN_DEFAULT
+    if not user_config:
+        return _FROZEN_DEFAULT
+    merged = {**_FROZEN_DEFAULT, **user_config}
+    if "validation_rules" in user_config and not isinstance(user_config["validation_rules"], list):
+        # Reported once per config version; treated as "no user rules"
+        print(
+            f"⚠️ {config_path}: validation_rules must be a list, "
+            f"got {type(user_config['validation_rules']).__name__}; ignoring it",
+            file=sys.stderr,
+        )
+        merged["validation_rules"] = []
+    elif "validation_rules" in user_config:
+        merged["validation_rules"] = _compile_rules(user_config["validation_rules"])
+        # Reported once per config version, not on every validation
+        for rule in merged["validation_rules"]:
+            if rule["_compile_error"]:
+                field = rule["_invalid_field"]
+                what = "rule" if field == "rule" else f"{field} for rule"
+                print(
+                    f"⚠️ {config_path}: invalid {what} "
+                    f"'{rule.get('id', 'unknown')}': {rule['_compile_error']}",
+                    file=sys.stderr,
+                )
+    for key in _NESTED_KEYS.intersection(user_config):
+        override = user_config[key]
+        if isinstance(override, dict):
+            merged[key] = {**DEFAULT_CONFIG[key], **override}
+    return merged
+
+
+def load_config() -> Mapping:
+    """
+    Load configuration from .jest-helper.json or use defaults.
+
+    The parsed file is cached until its mtime/size changes, and the defaults
+    are returned as a shared read-only view (no copy), so the result must
+    always be treated as read-only. A missing file is only re-checked every
+    _CONFIG_MISSING_TTL seconds.
+    """
+    config_path = _project_root_path() / ".jest-helper.json"
+    key = str(config_path)
+
+    retry_at = _CONFIG_MISSING.get(key)
+    if retry_at is not None and time.monotonic() < retry_at:
+        return _FROZEN_DEFAULT
+
+    try:
+        return _mtime_cached(_CONFIG_CACHE, config_path, _parse_config)
+    except FileNotFoundError:
+        _CONFIG_MISSING[key] = time.monotonic() + _CONFIG_MISSING_TTL
+        return _FROZEN_DEFAULT
+    except (json.JSONDecodeError, IOError):
+        return _FROZEN_DEFAULT
 
 
 # ============================================================
@@ -289,33 +833,17 @@ def find_test_files(directory: str = "") -> str:
     Returns:
         List of test file paths, one per line.
     """
-    project_root = get_project_root()
-    search_path = Path(project_root) / directory if directory else Path(project_root)
+    project_root = _project_root_path()
+    search_path = project_root / directory if directory else project_root
 
     if not search_path.exists():
         return f"Error: Directory not found: {search_path}"
 
-    # Find files matching common test patterns
-    test_patterns = [
-        "**/*.test.ts",
-        "**/*.test.tsx",
-        "**/*.test.js",
-        "**/*.test.jsx",
-        "**/*.spec.ts",
-        "**/*.spec.tsx",
-        "**/*.spec.js",
-        "**/*.spec.jsx",
-    ]
-
-    test_files = []
-    for pattern in test_patterns:
-        test_files.extend(search_path.glob(pattern))
-
-    # Filter out node_modules
-    test_files = [f for f in test_files if "node_modules" not in str(f)]
-
-    # Return relative paths for readability
-    relative_paths = [str(f.relative_to(project_root)) for f in sorted(test_files)]
+    # Single walk over the tree; node_modules etc. are pruned during the walk.
+    # Relative paths (for readability) come straight from the walk.
+    relative_paths = sorted(
+        relative for relative, _ in _iter_test_files(search_path, base=project_root)
+    )
 
     if not relative_paths:
         return "No test files found."
@@ -339,22 +867,35 @@ def read_file(file_path: str) -> str:
     if error:
         return error
 
-    if not full_path.exists():
+    # Open once and check the open descriptor (fstat) rather than stat'ing
+    # the path three times. O_NONBLOCK keeps a FIFO from blocking the open.
+    try:
+        fd = os.open(full_path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except FileNotFoundError:
         return f"Error: File not found: {full_path}"
-
-    if not full_path.is_file():
+    except IsADirectoryError:
         return f"Error: Not a file: {full_path}"
-
-    # Security: Check file size before reading
-    file_size = full_path.stat().st_size
-    if file_size > MAX_FILE_SIZE:
-        return f"⚠️ File too large ({file_size:,} bytes). Max: {MAX_FILE_SIZE:,} bytes"
+    except OSError as e:
+        return f"Error reading file: {e}"
 
     try:
-        content = full_path.read_text(encoding="utf-8")
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            return f"Error: Not a file: {full_path}"
+
+        # Security: Check file size before reading
+        if st.st_size > MAX_FILE_SIZE:
+            return f"⚠️ File too large ({st.st_size:,} bytes). Max: {MAX_FILE_SIZE:,} bytes"
+
+        with os.fdopen(fd, encoding="utf-8") as f:
+            fd = -1  # now owned (and closed) by f
+            content = f.read()
         return _truncate_output(content)
     except Exception as e:
         return f"Error reading file: {e}"
+    finally:
+        if fd != -1:
+            os.close(fd)
 
 
 @mcp.tool()
@@ -368,28 +909,48 @@ def find_source_for_test(test_file_path: str) -> str:
     Returns:
         The likely source file path, or candidates if multiple found.
     """
-    project_root = get_project_root()
-    test_path = Path(project_root) / test_file_path
+    project_root = _project_root_path()
+    test_path = project_root / test_file_path
 
     # Remove test suffix to find source file
     # Button.test.tsx -> Button.tsx
     # Button.spec.tsx -> Button.tsx
-    source_name = re.sub(r'\.(test|spec)\.(tsx?|jsx?)$', '', test_path.name)
+    source_name = _RE_TEST_SUFFIX.sub('', test_path.name)
 
     # Add back extension
     possible_extensions = ['.tsx', '.ts', '.jsx', '.js']
-    candidates = []
+    wanted = {f"{source_name}{ext}" for ext in possible_extensions}
+
+    # List the same directory and its parent (for __tests__ folders) once
+    # each instead of stat'ing every name/extension combination. The parent
+    # is only checked for __tests__ folders or when nothing was found beside
+    # the test.
+    search_dirs = []
+    for directory in (test_path.parent, test_path.parent.parent):
+        if search_dirs and test_path.parent.name != "__tests__":
+            break
+        try:
+            with os.scandir(directory) as it:
+                present = {entry.name for entry in it if entry.name in wanted}
+        except OSError:
+            continue
+        if not present:
+            continue
+        # An absolute test path may reach the root through a symlink, so
+        # fall back to comparing resolved paths; skip dirs outside the root.
+        for candidate in (directory, Path(os.path.realpath(directory))):
+            try:
+                search_dirs.append((candidate.relative_to(project_root), present))
+                break
+            except ValueError:
+                pass
 
+    candidates = []
     for ext in possible_extensions:
-        # Check same directory
-        same_dir = test_path.parent / f"{source_name}{ext}"
-        if same_dir.exists():
-            candidates.append(str(same_dir.relative_to(Path(project_root))))
-
-        # Check parent directory (for __tests__ folders)
-        parent_dir = test_path.parent.parent / f"{source_name}{ext}"
-        if parent_dir.exists():
-            candidates.append(str(parent_dir.relative_to(Path(project_root))))
+        name = f"{source_name}{ext}"
+        for rel_dir, present in search_dirs:
+            if name in present:
+                candidates.append(str(rel_dir / name))
 
     if not candidates:
         return f"Could not find source file for {test_file_path}. Expected something like {source_name}.tsx"
@@ -400,8 +961,150 @@ def find_source_for_test(test_file_path: str) -> str:
     return "Multiple candidates found:\n" + "\n".join(candidates)
 
 
+def _probe_features(content: str, analysis: dict) -> None:
+    """Record every _FEATURE_PROBES label whose substring appears in content."""
+    for token, key, label in _FEATURE_PROBES:
+        found = analysis[key]
+        if label not in found and token in content:
+            found[label] = None
+
+
+def _detect_structure(content: str) -> list[str]:
+    """Return the test-structure labels that apply to a file.
+
+    Each marker is probed once as a plain substring. A line-start ``test(`` is
+    checked as a start-of-content or newline-prefixed substring, which is
+    exactly what ``^test\\(`` with re.MULTILINE matches but without
+    running the regex engine over the whole file.
+
+    Args:
+        content: Test file content
+
+    Returns:
+        Structure labels, e.g. ["describe + it"]
+    """
+    has_describe = "describe(" in content
+    has_test = "test(" in content
+    found = []
+    if has_describe and "it(" in content:
+        found.append("describe + it")
+    if has_describe and has_test:
+        found.append("describe + test")
+    if has_test and (content.startswith("test(") or "\ntest(" in content):
+        found.append("standalone test()")
+    return found
+
+
+def _read_analysis_sample(path: str, full_read: bool = False) -> str | None:
+    """Read one sampled test file for analysis, or None if it can't be read."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            return fh.read(-1 if full_read else _ANALYZE_READ_LIMIT)
+    except OSError:
+        return None
+
+
+def _analyze_sample(relative_path: str, content: str, analysis: dict) -> None:
+    """
+    Fold one test file's patterns into the running analysis.
+
+    Files are folded in sample order; "first file that has it" examples and
+    the capped naming lists depend on that order.
+    """
+    analysis["files_analyzed"].append(relative_path)
+
+    # Extract import section from the top of the first file that has one
+    if not analysis["example_imports"]:
+        import_lines = []
+        for line_no, line in enumerate(_iter_lines(content)):
+            stripped = line.strip()
+            if stripped.startswith(('import ', 'from ')):
+                import_lines.append(line)
+            elif import_lines and not stripped:
+                continue
+            elif import_lines or line_no >= _IMPORT_SCAN_LINES:
+                break
+        if import_lines:
+            analysis["example_imports"] = '\n'.join(import_lines[:10])
+
+    # Detect libraries, utilities, mocking and assertion patterns
+    _probe_features(content, analysis)
+
+    # Detect test structure
+    analysis["test_structure"].update(dict.fromkeys(_detect_structure(content)))
+
+    # Extract describe naming examples
+    # (the report only shows _NAMING_EXAMPLES, so stop once full)
+    if len(analysis["describe_naming"]) < _NAMING_EXAMPLES:
+        analysis["describe_naming"].update(dict.fromkeys(
+            m.group(1) for m in itertools.islice(_RE_DESCRIBE_NAME.finditer(content), 3)
+        ))
+
+    # Extract it/test naming examples
+    if len(analysis["it_naming"]) < _NAMING_EXAMPLES:
+        analysis["it_naming"].update(dict.fromkeys(
+            m.group(1) for m in itertools.islice(_RE_IT_NAME.finditer(content), 5)
+        ))
+        analysis["it_naming"].update(dict.fromkeys(
+            m.group(1) for m in itertools.islice(_RE_TEST_NAME.finditer(content), 5)
+        ))
+
+    # Check for AAA comments
+    if not analysis["uses_aaa_comments"] and _RE_AAA.search(content):
+        analysis["uses_aaa_comments"] = True
+
+    # Detect setup/teardown
+    if not analysis["beforeEach_usage"] and "beforeEach(" in content:
+        analysis["beforeEach_usage"] = True
+    if not analysis["afterEach_usage"] and "afterEach(" in content:
+        analysis["afterEach_usage"] = True
+
+    # Extract a full describe block example
+    if not analysis["example_describe"]:
+        describe_match = _RE_DESCRIBE_BLOCK.search(content)
+        if describe_match:
+            example = describe_match.group(1)
+            if len(example) < 1500:  # Not too long
+                analysis["example_describe"] = example
+
+    # Extract an it block example
+    if not analysis["example_it"]:
+        it_match = _RE_IT_BLOCK.search(content)
+        if it_match:
+            example = it_match.group(1)
+            if len(example) < 800:  # Not too long
+                analysis["example_it"] = example
+
+
+# Fixed parts of the analyze_test_patterns report, built once
+_ANALYSIS_HEADER = (
+    f"╔{_BOX_H60}╗\n"
+    f"║  🔬 TEST PATTERN ANALYSIS{_PAD34}║\n"
+    f"╚{_BOX_H60}╝\n"
+    "\n"
+)
+_ANALYSIS_BOX_END = f"└{'─' * 60}┘\n"
+
+
+def _analysis_saturated(analysis: dict) -> bool:
+    """
+    Whether the running analysis has seen enough to describe the style.
+
+    True once all three code examples are captured and the mocking and
+    assertion findings have filled out; later files rarely add more.
+    """
+    return (
+        len(analysis["files_analyzed"]) >= _ANALYZE_MIN_FILES
+        and bool(analysis["example_imports"])
+        and bool(analysis["example_describe"])
+        and bool(analysis["example_it"])
+        and len(analysis["mocking_patterns"]) >= 3
+        and len(analysis["assertion_patterns"]) >= 4
+    )
+
+
 @mcp.tool()
-def analyze_test_patterns(sample_count: int = 5) -> str:
+def analyze_test_patterns(sample_count: int = 5, full_read: bool = False) -> str:
     """
     Deeply analyze existing tests to understand the testing patterns used.
 
@@ -416,38 +1119,42 @@ def analyze_test_patterns(sample_count: int = 5) -> str:
     IMPORTANT: Claude should use this to understand and replicate
     the EXACT style used in this codebase.
 
+    Only the first 256K characters of each file are analyzed unless
+    full_read is set; extracted examples are far shorter than that.
+    sample_count is an upper bound: analysis stops early once the sampled
+    files have already yielded examples and a full set of patterns.
+
     Args:
-        sample_count: Number of test files to sample (default 5)
+        sample_count: Maximum number of test files to sample (default 5)
+        full_read: Analyze whole files instead of the first 256K characters (default False)
 
     Returns:
         Comprehensive analysis with real code examples.
     """
-    project_root = get_project_root()
+    project_root = _project_root_path()
 
     # Find test files
-    test_patterns = ["**/*.test.tsx", "**/*.test.ts", "**/*.test.jsx", "**/*.test.js"]
-    test_files = []
-    for pattern in test_patterns:
-        test_files.extend(Path(project_root).glob(pattern))
-
-    test_files = [f for f in test_files if "node_modules" not in str(f)]
+    test_files = list(_iter_test_files(project_root, _DOT_TEST_SUFFIXES))
 
     if not test_files:
         return "No test files found to analyze. Use get_test_template() for canonical examples."
 
-    # Get most recent files (likely most up-to-date style)
-    test_files = sorted(test_files, key=lambda x: x.stat().st_mtime, reverse=True)
-    sample = test_files[:sample_count]
+    # Get most recent files (likely most up-to-date style). Stat each file
+    # once and keep only the top `sample_count` instead of sorting them all.
+    stamped = [(os.stat(path).st_mtime, relative, path) for relative, path in test_files]
+    sample = [(relative, path) for _, relative, path in heapq.nlargest(sample_count, stamped)]
 
+    # Collections are dicts used as insertion-ordered sets, so the report
+    # lists findings in the order they were first seen (deterministically).
     analysis = {
         "files_analyzed": [],
-        "import_patterns": [],
-        "test_structure": set(),
-        "describe_naming": [],
-        "it_naming": [],
-        "mocking_patterns": set(),
-        "common_utilities": set(),
-        "assertion_patterns": set(),
+        "import_patterns": {},
+        "test_structure": {},
+        "describe_naming": {},
+        "it_naming": {},
+        "mocking_patterns": {},
+        "common_utilities": {},
+        "assertion_patterns": {},
         "uses_aaa_comments": False,
         "beforeEach_usage": False,
         "afterEach_usage": False,
@@ -456,199 +1163,87 @@ def analyze_test_patterns(sample_count: int = 5) -> str:
         "example_it": "",
     }
 
-    for test_file in sample:
-        try:
-            content = test_file.read_text(encoding="utf-8")
-            relative_path = str(test_file.relative_to(project_root))
-            analysis["files_analyzed"].append(relative_path)
-
-            lines = content.split('\n')
-
-            # Extract import section
-            import_lines = []
-            for line in lines:
-                if line.strip().startswith('import ') or line.strip().startswith('from '):
-                    import_lines.append(line)
-                elif import_lines and not line.strip():
-                    continue
-                elif import_lines:
-                    break
-            if import_lines and not analysis["example_imports"]:
-                analysis["example_imports"] = '\n'.join(import_lines[:10])
-
-            # Detect import patterns
-            if "@testing-library/react" in content:
-                analysis["import_patterns"].append("@testing-library/react")
-            if "@testing-library/user-event" in content:
-                analysis["import_patterns"].append("@testing-library/user-event")
-            if "@testing-library/jest-dom" in content:
-                analysis["import_patterns"].append("@testing-library/jest-dom")
-
-            # Detect common utilities
-            for util in ["render", "screen", "fireEvent", "userEvent", "waitFor", "act", "within"]:
-                if util in content:
-                    analysis["common_utilities"].add(util)
-
-            # Detect test structure
-            if "describe(" in content and "it(" in content:
-                analysis["test_structure"].add("describe + it")
-            if "describe(" in content and "test(" in content:
-                analysis["test_structure"].add("describe + test")
-            if re.search(r'^test\(', content, re.MULTILINE):
-                analysis["test_structure"].add("standalone test()")
-
-            # Extract describe naming examples
-            describe_matches = re.findall(r"describe\s*\(\s*['\"]([^'\"]+)['\"]", content)
-            analysis["describe_naming"].extend(describe_matches[:3])
-
-            # Extract it/test naming examples
-            it_matches = re.findall(r"it\s*\(\s*['\"]([^'\"]+)['\"]", content)
-            analysis["it_naming"].extend(it_matches[:5])
-            test_matches = re.findall(r"test\s*\(\s*['\"]([^'\"]+)['\"]", content)
-            analysis["it_naming"].extend(test_matches[:5])
-
-            # Check for AAA comments
-            if re.search(r'//\s*(Arrange|Act|Assert)', content):
-                analysis["uses_aaa_comments"] = True
-
-            # Detect setup/teardown
-            if "beforeEach(" in content:
-                analysis["beforeEach_usage"] = True
-            if "afterEach(" in content:
-                analysis["afterEach_usage"] = True
-
-            # Detect mocking patterns
-            if "jest.mock(" in content:
-                analysis["mocking_patterns"].add("jest.mock() - module mocking")
-            if "jest.fn()" in content:
-                analysis["mocking_patterns"].add("jest.fn() - function mocks")
-            if "jest.spyOn(" in content:
-                analysis["mocking_patterns"].add("jest.spyOn() - spy on methods")
-            if "mockImplementation" in content:
-                analysis["mocking_patterns"].add("mockImplementation()")
-            if "mockResolvedValue" in content:
-                analysis["mocking_patterns"].add("mockResolvedValue() - async mocks")
-            if "mockReturnValue" in content:
-                analysis["mocking_patterns"].add("mockReturnValue()")
-
-            # Detect assertion patterns
-            if "toBeInTheDocument" in content:
-                analysis["assertion_patterns"].add("toBeInTheDocument()")
-            if "toHaveBeenCalled" in content:
-                analysis["assertion_patterns"].add("toHaveBeenCalled()")
-            if "toHaveBeenCalledWith" in content:
-                analysis["assertion_patterns"].add("toHaveBeenCalledWith()")
-            if "toEqual" in content:
-                analysis["assertion_patterns"].add("toEqual()")
-            if "toBe(" in content:
-                analysis["assertion_patterns"].add("toBe()")
-            if "toMatchSnapshot" in content:
-                analysis["assertion_patterns"].add("toMatchSnapshot()")
-            if "toThrow" in content:
-                analysis["assertion_patterns"].add("toThrow()")
-
-            # Extract a full describe block example
-            if not analysis["example_describe"]:
-                describe_match = re.search(
-                    r"(describe\s*\(['\"][^'\"]+['\"],\s*\(\)\s*=>\s*\{[\s\S]*?^\});)",
-                    content,
-                    re.MULTILINE
-                )
-                if describe_match:
-                    example = describe_match.group(1)
-                    if len(example) < 1500:  # Not too long
-                        analysis["example_describe"] = example
-
-            # Extract an it block example
-            if not analysis["example_it"]:
-                it_match = re.search(
-                    r"(it\s*\(['\"][^'\"]+['\"],\s*(?:async\s*)?\(\)\s*=>\s*\{[\s\S]*?^\s*\});)",
-                    content,
-                    re.MULTILINE
-                )
-                if it_match:
-                    example = it_match.group(1)
-                    if len(example) < 800:  # Not too long
-                        analysis["example_it"] = example
-
-        except Exception:
-            continue
-
-    # Format output with visual boxes
-    output = [
-        f"╔{'═' * 60}╗",
-        f"║  🔬 TEST PATTERN ANALYSIS{' ' * 34}║",
-        f"╚{'═' * 60}╝",
-        "",
-        f"Analyzed {len(analysis['files_analyzed'])} files. Follow these patterns exactly.",
-        "",
+    # Read the sample concurrently (file I/O releases the GIL) but analyze
+    # in order, so the "first file that has X" examples stay deterministic.
+    read_sample = functools.partial(_read_analysis_sample, full_read=full_read)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(8, len(sample)))) as pool:
+        contents = pool.map(read_sample, [path for _, path in sample])
+        for (relative_path, _), content in zip(sample, contents):
+            if content is None:
+                continue
+            _analyze_sample(relative_path, content, analysis)
+            if _analysis_saturated(analysis):
+                pool.shutdown(wait=False, cancel_futures=True)
+                break
+
+    # Format output with visual boxes. Each section is built as a single
+    # string (trailing "\n" stands for the blank separator line).
+    sections = [
+        _ANALYSIS_HEADER
+        + f"Analyzed {len(analysis['files_analyzed'])} files. Follow these patterns exactly.\n",
     ]
 
     # Files analyzed
-    output.append("┌─ Files Analyzed ───────────────────────────────────────────┐")
-    for f in analysis["files_analyzed"]:
-        output.append(f"│ • {f[:57]:<57}│")
-    output.append("└────────────────────────────────────────────────────────────┘")
-    output.append("")
+    sections.append(
+        "┌─ Files Analyzed ───────────────────────────────────────────┐\n"
+        + "".join(f"│ • {f:<57.57}│\n" for f in analysis["files_analyzed"])
+        + _ANALYSIS_BOX_END
+    )
 
     # Test structure summary
-    output.append("┌─ Test Structure ───────────────────────────────────────────┐")
-    output.append(f"│ Pattern      : {' / '.join(analysis['test_structure']) or 'Unknown':<44}│")
-    output.append(f"│ beforeEach   : {'✓ Yes' if analysis['beforeEach_usage'] else '✗ No':<44}│")
-    output.append(f"│ afterEach    : {'✓ Yes' if analysis['afterEach_usage'] else '✗ No':<44}│")
-    output.append(f"│ AAA Comments : {'✓ Yes' if analysis['uses_aaa_comments'] else '✗ No':<44}│")
-    output.append("└────────────────────────────────────────────────────────────┘")
-    output.append("")
+    sections.append(
+        "┌─ Test Structure ───────────────────────────────────────────┐\n"
+        f"│ Pattern      : {' / '.join(analysis['test_structure']) or 'Unknown':<44}│\n"
+        f"│ beforeEach   : {'✓ Yes' if analysis['beforeEach_usage'] else '✗ No':<44}│\n"
+        f"│ afterEach    : {'✓ Yes' if analysis['afterEach_usage'] else '✗ No':<44}│\n"
+        f"│ AAA Comments : {'✓ Yes' if analysis['uses_aaa_comments'] else '✗ No':<44}│\n"
+        + _ANALYSIS_BOX_END
+    )
 
     # Naming conventions
-    output.append("┌─ Naming Conventions ──────────────────────────────────────┐")
-    output.append("│ describe() examples:                                       │")
-    for name in list(set(analysis["describe_naming"]))[:4]:
-        output.append(f"│   • {name[:54]:<54}│")
-    output.append("│ it()/test() examples:                                      │")
-    for name in list(set(analysis["it_naming"]))[:4]:
-        output.append(f"│   • {name[:54]:<54}│")
-    output.append("└────────────────────────────────────────────────────────────┘")
-    output.append("")
+    sections.append(
+        "┌─ Naming Conventions ──────────────────────────────────────┐\n"
+        "│ describe() examples:                                       │\n"
+        + "".join(f"│   • {name:<54.54}│\n" for name in itertools.islice(analysis["describe_naming"], _NAMING_EXAMPLES))
+        + "│ it()/test() examples:                                      │\n"
+        + "".join(f"│   • {name:<54.54}│\n" for name in itertools.islice(analysis["it_naming"], _NAMING_EXAMPLES))
+        + _ANALYSIS_BOX_END
+    )
 
     # Imports & Utilities
-    output.append("┌─ Libraries & Utilities ─────────────────────────────────────┐")
-    libs = list(set(analysis["import_patterns"]))
-    if libs:
-        output.append(f"│ Libraries: {', '.join(libs)[:48]:<48}│")
+    libs = list(analysis["import_patterns"])
     utils = ', '.join(sorted(analysis['common_utilities']))
-    output.append(f"│ Utilities: {utils[:48]:<48}│")
-    output.append("└────────────────────────────────────────────────────────────┘")
-    output.append("")
+    sections.append(
+        "┌─ Libraries & Utilities ─────────────────────────────────────┐\n"
+        + (f"│ Libraries: {', '.join(libs):<48.48}│\n" if libs else "")
+        + f"│ Utilities: {utils:<48.48}│\n"
+        + _ANALYSIS_BOX_END
+    )
 
     # Mocking patterns
     if analysis["mocking_patterns"]:
-        output.append("┌─ Mocking Patterns ──────────────────────────────────────────┐")
-        for mock in list(analysis["mocking_patterns"])[:5]:
-            output.append(f"│ • {mock[:56]:<56}│")
-        output.append("└────────────────────────────────────────────────────────────┘")
-        output.append("")
+        sections.append(
+            "┌─ Mocking Patterns ──────────────────────────────────────────┐\n"
+            + "".join(f"│ • {mock:<56.56}│\n" for mock in itertools.islice(analysis["mocking_patterns"], 5))
+            + _ANALYSIS_BOX_END
+        )
 
     # Assertion patterns
     if analysis["assertion_patterns"]:
-        output.append("┌─ Assertion Patterns ────────────────────────────────────────┐")
         assertions = ', '.join(analysis["assertion_patterns"])
-        output.append(f"│ {assertions[:58]:<58}│")
-        output.append("└────────────────────────────────────────────────────────────┘")
-        output.append("")
+        sections.append(
+            "┌─ Assertion Patterns ────────────────────────────────────────┐\n"
+            f"│ {assertions:<58.58}│\n"
+            + _ANALYSIS_BOX_END
+        )
 
     # Real example
     if analysis["example_it"]:
-        output.append("## Real Example from Codebase")
-        output.append("```typescript")
-        output.append(analysis["example_it"])
-        output.append("```")
-        output.append("")
+        sections.append(f"## Real Example from Codebase\n```typescript\n{analysis['example_it']}\n```\n")
 
-    output.append("─" * 62)
-    output.append("**Use these exact patterns when writing new tests.**")
+    sections.append(f"{'─' * 62}\n**Use these exact patterns when writing new tests.**")
 
-    return "\n".join(output)
+    return "\n".join(sections)
 
 
 # ============================================================
@@ -675,7 +1270,7 @@ def run_tests(
     Returns:
         Test results including passes, failures, and error messages.
     """
-    project_root = get_project_root()
+    project_root = _project_root_path()
 
     # Build the Jest command
     cmd = ["npm", "test", "--"]
@@ -696,19 +1291,34 @@ def run_tests(
     cmd.append("--verbose")
 
     try:
-        result = subprocess.run(
+        # stderr is merged into stdout by the OS, so there's a single pipe.
+        # It is read as bytes; only the lines kept after truncation are decoded.
+        # On POSIX Jest gets its own process group so a timeout can kill
+        # npm's child processes too (they hold the pipe open otherwise).
+        with subprocess.Popen(
             cmd,
             cwd=project_root,
-            capture_output=True,
-            text=True,
-            timeout=120  # 2 minute timeout
-        )
-
-        output = result.stdout + "\n" + result.stderr
-        output = _truncate_output(output)
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=os.name == "posix",
+        ) as proc:
+            timed_out = threading.Event()
+            timer = threading.Timer(_RUN_TIMEOUT_SECONDS, _kill_process_tree, (proc, timed_out))
+            timer.start()
+            try:
+                output = _read_truncated(proc.stdout)
+                proc.wait()
+            finally:
+                timer.cancel()
+
+        # The timer can fire just as Jest exits on its own; only count it as
+        # a timeout if the kill is what ended the process.
+        killed_status = -signal.SIGKILL if os.name == "posix" else 1
+        if timed_out.is_set() and proc.returncode == killed_status:
+            raise subprocess.TimeoutExpired(cmd, _RUN_TIMEOUT_SECONDS)
 
         # Add summary at the top
-        if result.returncode == 0:
+        if proc.returncode == 0:
             return "✅ All tests passed!\n\n" + output
         else:
             return "❌ Some tests failed!\n\n" + output
@@ -719,6 +1329,63 @@ def run_tests(
         return f"Error running tests: {e}"
 
 
+def _kill_process_tree(proc: subprocess.Popen, killed: threading.Event) -> None:
+    """
+    Kill a timed-out test run, including npm's children on POSIX.
+
+    `killed` is only set if Jest itself was still running: if it already
+    exited (and only stray children hold the pipe), the run finished and
+    the group is killed just to release the pipe.
+    """
+    if proc.poll() is None:
+        killed.set()
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+
+
+def _universal_lines(stream) -> Iterator[bytes]:
+    """
+    Yield the lines of a binary stream with '\\r\\n' and lone '\\r' turned
+    into '\\n', split exactly where a text-mode pipe would split them.
+    """
+    for line in stream:
+        if b"\r" in line:
+            yield from line.replace(b"\r\n", b"\n").replace(b"\r", b"\n").splitlines(keepends=True)
+        else:
+            yield line
+
+
+def _read_truncated(stream, max_lines: int = MAX_OUTPUT_LINES) -> str:
+    """
+    Read a binary stream and return it as _truncate_output would, without
+    holding all of it in memory or decoding lines that get dropped.
+
+    Newlines are normalized the way a text-mode pipe would before lines are
+    counted. Only the first max_lines // 2 and the last max_lines lines are
+    kept; each line dropped in between is replaced by a bare newline so the
+    line count (and therefore the truncation message) comes out identical.
+    Kept lines are decoded as UTF-8 (undecodable bytes become U+FFFD).
+    """
+    half = max_lines // 2
+    head = []
+    tail = collections.deque(maxlen=max_lines if half > 0 else None)
+    dropped = 0
+    for line in _universal_lines(stream):
+        if len(head) < half:
+            head.append(line)
+            continue
+        if len(tail) == tail.maxlen:
+            dropped += 1
+        tail.append(line)
+    kept = b"".join(head) + b"\n" * dropped + b"".join(tail)
+    return _truncate_output(kept.decode("utf-8", errors="replace"), max_lines)
+
+
 @mcp.tool()
 def run_single_test(test_file: str, test_name: str = "") -> str:
     """
@@ -751,16 +1418,16 @@ def write_test_file(file_path: str, content: str) -> str:
     Returns:
         Success or error message.
     """
-    project_root = get_project_root()
-    full_path = Path(project_root) / file_path
+    project_root = _project_root_path()
+    full_path = project_root / file_path
 
     # Safety check: only allow test files
-    if not any(pattern in file_path for pattern in ['.test.', '.spec.']):
-        return "Error: Can only write test files (.test.* or .spec.*)"
+    if not _RE_TEST_SUFFIX.search(file_path):
+        return "Error: Can only write test files (.test.{ts,tsx,js,jsx} or .spec.{ts,tsx,js,jsx})"
 
     # Safety check: don't write outside project
     try:
-        full_path.resolve().relative_to(Path(project_root).resolve())
+        full_path.resolve().relative_to(project_root)
     except ValueError:
         return "Error: Cannot write outside project directory"
 
@@ -768,12 +1435,75 @@ def write_test_file(file_path: str, content: str) -> str:
     full_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        full_path.write_text(content, encoding="utf-8")
+        _atomic_write_text(full_path, content)
         return f"✅ Successfully wrote test file: {file_path}"
     except Exception as e:
         return f"Error writing file: {e}"
 
 
+# Process umask, read once: os.umask can only be queried by setting it,
+# which is not safe to do while other threads create files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """
+    Write `content` to `path` so readers see either the old or the new file.
+
+    The text goes to a temp file in the same directory, is fsync'd, and is
+    then renamed over the target with os.replace. An existing file keeps
+    its permission bits; the temp file is removed if anything fails.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            # New file: mkstemp's 0600 is too strict, use the umask default
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _replace_in_place(path: Path, old: bytes, new: bytes) -> bool:
+    """
+    Overwrite the first occurrence of `old` with the same-length `new` via mmap.
+
+    Returns False (nothing written) when the fast path doesn't apply: empty
+    file or pattern, no byte-level match, a file containing '\\r', where
+    text-mode newline translation could make the text-level match differ,
+    or a file that isn't valid UTF-8 (the text path reports those).
+    """
+    if not old:
+        return False
+    with open(path, "r+b") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0) as mm:
+            if mm.find(b"\r") != -1:
+                return False
+            try:
+                str(mm, "utf-8")
+            except UnicodeDecodeError:
+                return False
+            idx = mm.find(old)
+            if idx == -1:
+                return False
+            mm[idx:idx + len(new)] = new
+            mm.flush()
+    return True
+
+
 @mcp.tool()
 def update_test_section(
     file_path: str,
@@ -797,20 +1527,26 @@ def update_test_section(
         return error
 
     # Security: Only allow updating test files
-    if not any(pattern in file_path for pattern in ['.test.', '.spec.']):
-        return "⛔ Security: Can only update test files (.test.* or .spec.*)"
+    if not _RE_TEST_SUFFIX.search(file_path):
+        return "⛔ Security: Can only update test files (.test.{ts,tsx,js,jsx} or .spec.{ts,tsx,js,jsx})"
 
     if not full_path.exists():
         return f"Error: File not found: {file_path}"
 
     try:
+        old_bytes = old_content.encode("utf-8")
+        new_bytes = new_content.encode("utf-8")
+        if len(old_bytes) == len(new_bytes) and _replace_in_place(full_path, old_bytes, new_bytes):
+            return f"✅ Successfully updated: {file_path}"
+
         content = full_path.read_text(encoding="utf-8")
 
-        if old_content not in content:
+        # One search, then splice (instead of `in` followed by replace()).
+        idx = content.find(old_content)
+        if idx == -1:
             return "Error: Could not find the content to replace. Make sure it matches exactly."
 
-        updated_content = content.replace(old_content, new_content, 1)
-        full_path.write_text(updated_content, encoding="utf-8")
+        _atomic_write_text(full_path, content[:idx] + new_content + content[idx + len(old_content):])
 
         return f"✅ Successfully updated: {file_path}"
     except Exception as e:
@@ -829,7 +1565,7 @@ def get_jest_config() -> str:
     Returns:
         Jest configuration details.
     """
-    project_root = get_project_root()
+    project_root = _project_root_path()
 
     config_files = [
         "jest.config.js",
@@ -839,24 +1575,44 @@ def get_jest_config() -> str:
     ]
 
     for config_file in config_files:
-        config_path = Path(project_root) / config_file
-        if config_path.exists():
-            content = config_path.read_text(encoding="utf-8")
-            return f"Found {config_file}:\n\n{content}"
+        config_path = project_root / config_file
+        try:
+            content = _mtime_cached(_JEST_CONFIG_CACHE, config_path, _read_jest_config_file)
+        except FileNotFoundError:
+            continue
+        return f"Found {config_file}:\n\n{content}"
 
     # Check package.json for jest config
-    package_json_path = Path(project_root) / "package.json"
-    if package_json_path.exists():
-        try:
-            package_data = json.loads(package_json_path.read_text())
-            if "jest" in package_data:
-                return "Jest config in package.json:\n\n" + json.dumps(package_data["jest"], indent=2)
-        except json.JSONDecodeError:
-            pass
+    package_json_path = project_root / "package.json"
+    try:
+        package_config = _mtime_cached(_JEST_CONFIG_CACHE, package_json_path, _read_package_jest_config)
+    except FileNotFoundError:
+        package_config = None
+    if package_config is not None:
+        return "Jest config in package.json:\n\n" + package_config
 
     return "No Jest configuration file found. Using default Jest config."
 
 
+def _read_jest_config_file(config_path: Path) -> str:
+    return config_path.read_text(encoding="utf-8")
+
+
+def _read_package_jest_config(package_json_path: Path) -> str | None:
+    """Return the pretty-printed "jest" section of package.json, if any."""
+    raw = package_json_path.read_bytes()
+    # Most package.json files have no jest section; don't parse those at all
+    if b'"jest"' not in raw:
+        return None
+    try:
+        package_data = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    if "jest" in package_data:
+        return json.dumps(package_data["jest"], indent=2)
+    return None
+
+
 @mcp.tool()
 def list_project_structure(directory: str = "src", max_depth: int = 3) -> str:
     """
@@ -869,34 +1625,36 @@ def list_project_structure(directory: str = "src", max_depth: int = 3) -> str:
     Returns:
         Tree-like structure of the project.
     """
-    project_root = get_project_root()
-    start_path = Path(project_root) / directory
+    start_path = _project_root_path() / directory
 
     if not start_path.exists():
         return f"Directory not found: {directory}"
 
-    def build_tree(path: Path, prefix: str = "", depth: int = 0) -> list:
+    def build_tree(path: str, prefix: str = "", depth: int = 0) -> list:
         if depth >= max_depth:
             return []
 
-        items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name))
+        # DirEntry caches the file type from readdir, so sorting and the
+        # is_dir() check below don't stat every entry.
+        with os.scandir(path) as it:
+            items = sorted(
+                (entry for entry in it if entry.name not in _SKIP_DIRS),
+                key=lambda e: (e.is_file(), e.name),
+            )
         lines = []
 
         for i, item in enumerate(items):
-            if item.name in ["node_modules", ".git", "__pycache__", ".venv"]:
-                continue
-
             is_last = i == len(items) - 1
             current_prefix = "└── " if is_last else "├── "
             lines.append(f"{prefix}{current_prefix}{item.name}")
 
             if item.is_dir():
                 next_prefix = prefix + ("    " if is_last else "│   ")
-                lines.extend(build_tree(item, next_prefix, depth + 1))
+                lines.extend(build_tree(item.path, next_prefix, depth + 1))
 
         return lines
 
-    tree_lines = [directory + "/"] + build_tree(start_path)
+    tree_lines = [directory + "/"] + build_tree(str(start_path))
     return "\n".join(tree_lines)
 
 
@@ -905,6 +1663,71 @@ def list_project_structure(directory: str = "src", max_depth: int = 3) -> str:
 # These tools ensure all developers write tests the same way
 # ============================================================
 
+# Rendered with str.format; only the eight style fields are substituted.
+# _STYLE_GUIDE_DEFAULTS also backs rewrite_test_to_standard's style summary.
+_STYLE_GUIDE_TEMPLATE = """╔════════════════════════════════════════════════════════════╗
+║  📋 TEAM TEST STYLE GUIDE                                  ║
+╚════════════════════════════════════════════════════════════╝
+
+Follow these rules exactly for consistency across all developers.
+
+┌─ Structure ────────────────────────────────────────────────┐
+│ Test Structure   : {test_structure:<40}│
+│ it() Naming      : {it_naming:<40}│
+│ describe() Naming: {describe_naming:<40}│
+└────────────────────────────────────────────────────────────┘
+
+┌─ Code Organization ────────────────────────────────────────┐
+│ Arrangement      : {arrangement:<40}│
+│ Imports Order    : {imports_order:<40.40}│
+│ Mock Location    : {mock_location:<40}│
+└────────────────────────────────────────────────────────────┘
+
+┌─ Test Quality ─────────────────────────────────────────────┐
+│ Assertions/Test  : {assertions_per_test:<40}│
+│ Edge Cases       : {edge_cases_required:<40.40}│
+└────────────────────────────────────────────────────────────┘
+
+## Example: Good vs Bad Naming
+```javascript
+// ✅ CORRECT
+describe('Button', () => {{
+  it('should render with default props', () => {{ ... }});
+  it('should call onClick when clicked', () => {{ ... }});
+}});
+
+// ❌ INCORRECT
+describe('Button tests', () => {{
+  it('renders', () => {{ ... }});
+  it('click works', () => {{ ... }});
+}});
+```
+
+## Example: Clean Test Structure
+```javascript
+it('should handle form submission', async () => {{
+  const mockSubmit = jest.fn();
+  render(<Form onSubmit={{mockSubmit}} />);
+
+  await userEvent.click(screen.getByRole('button', {{ name: 'Submit' }}));
+
+  expect(mockSubmit).toHaveBeenCalledTimes(1);
+}});
+```"""
+_STYLE_GUIDE_DEFAULTS = {
+    "test_structure": "describe + it",
+    "it_naming": "should + verb",
+    "describe_naming": "component/function name",
+    "arrangement": "AAA structure",
+    "mock_location": "top of file",
+    "assertions_per_test": "1-3",
+}
+
+# Last rendered style guide: id(style_guide) -> (style_guide, text). The dict
+# itself is kept so its id can't be reused by a different object.
+_STYLE_GUIDE_CACHE: dict[int, tuple[Mapping, str]] = {}
+
+
 @mcp.tool()
 def get_test_style_guide() -> str:
     """
@@ -919,68 +1742,35 @@ def get_test_style_guide() -> str:
     config = load_config()
     style = config.get("style_guide", {})
 
-    guide = [
-        f"╔{'═' * 60}╗",
-        f"║  📋 TEAM TEST STYLE GUIDE{' ' * 34}║",
-        f"╚{'═' * 60}╝",
-        "",
-        "Follow these rules exactly for consistency across all developers.",
-        "",
-        "┌─ Structure ────────────────────────────────────────────────┐",
-        f"│ Test Structure   : {style.get('test_structure', 'describe + it'):<40}│",
-        f"│ it() Naming      : {style.get('it_naming', 'should + verb'):<40}│",
-        f"│ describe() Naming: {style.get('describe_naming', 'component/function name'):<40}│",
-        "└────────────────────────────────────────────────────────────┘",
-        "",
-        "┌─ Code Organization ────────────────────────────────────────┐",
-        f"│ Arrangement      : {style.get('arrangement', 'AAA structure'):<40}│",
-        f"│ Imports Order    : {' → '.join(style.get('imports_order', []))[:40]:<40}│",
-        f"│ Mock Location    : {style.get('mock_location', 'top of file'):<40}│",
-        "└────────────────────────────────────────────────────────────┘",
-        "",
-        "┌─ Test Quality ─────────────────────────────────────────────┐",
-        f"│ Assertions/Test  : {style.get('assertions_per_test', '1-3'):<40}│",
-        f"│ Edge Cases       : {', '.join(style.get('edge_cases_required', []))[:40]:<40}│",
-        "└────────────────────────────────────────────────────────────┘",
-        "",
-        "## Example: Good vs Bad Naming",
-        "```javascript",
-        "// ✅ CORRECT",
-        "describe('Button', () => {",
-        "  it('should render with default props', () => { ... });",
-        "  it('should call onClick when clicked', () => { ... });",
-        "});",
-        "",
-        "// ❌ INCORRECT",
-        "describe('Button tests', () => {",
-        "  it('renders', () => { ... });",
-        "  it('click works', () => { ... });",
-        "});",
-        "```",
-        "",
-        "## Example: Clean Test Structure",
-        "```javascript",
-        "it('should handle form submission', async () => {",
-        "  const mockSubmit = jest.fn();",
-        "  render(<Form onSubmit={mockSubmit} />);",
-        "",
-        "  await userEvent.click(screen.getByRole('button', { name: 'Submit' }));",
-        "",
-        "  expect(mockSubmit).toHaveBeenCalledTimes(1);",
-        "});",
-        "```",
-    ]
+    # load_config hands out the same style_guide object until the config file
+    # changes, so the rendered guide can be reused while it's the same object.
+    cached = _STYLE_GUIDE_CACHE.get(id(style))
+    if cached is not None and cached[0] is style:
+        return cached[1]
+
+    fields = collections.ChainMap(
+        {
+            "imports_order": ' → '.join(style.get('imports_order', [])),
+            "edge_cases_required": ', '.join(style.get('edge_cases_required', [])),
+        },
+        style,
+        _STYLE_GUIDE_DEFAULTS,
+    )
+    rendered = _STYLE_GUIDE_TEMPLATE.format_map(fields)
 
     # Add custom rules if present
     custom_rules = style.get('custom_rules', [])
     if custom_rules:
-        guide.append("")
-        guide.append("┌─ Custom Team Rules ────────────────────────────────────────┐")
-        for rule in custom_rules:
-            guide.append(f"│ • {rule:<57}│")
-        guide.append("└────────────────────────────────────────────────────────────┘")
+        rule_lines = "\n".join(f"│ • {rule:<57}│" for rule in custom_rules)
+        rendered += f"""
 
-    return "\n".join(guide)
+┌─ Custom Team Rules ────────────────────────────────────────┐
+{rule_lines}
+└────────────────────────────────────────────────────────────┘"""
+
+    _STYLE_GUIDE_CACHE.clear()
+    _STYLE_GUIDE_CACHE[id(style)] = (style, rendered)
+    return rendered
 
 
 @mcp.tool()
@@ -1008,12 +1798,9 @@ def get_test_template(
     config = load_config()
     templates = config.get("templates", {})
 
-    available_types = list(templates.keys())
-
-    if template_type not in templates:
-        return f"Error: Unknown template type '{template_type}'. Available types: {', '.join(available_types)}"
-
-    template = templates[template_type]
+    template = templates.get(template_type)
+    if template is None:
+        return f"Error: Unknown template type '{template_type}'. Available types: {', '.join(templates)}"
 
     # Replace placeholder names if component_name provided
     if component_name:
@@ -1035,6 +1822,42 @@ def get_test_template(
     return "\n".join(header) + template
 
 
+# Validation report frame; the per-rule lines go between head and tail
+_VALIDATION_REPORT_HEAD = f"""╔{_BOX_H64}╗
+║  🔍 TEST STYLE VALIDATION REPORT{' ' * 30}║
+╠{_BOX_H64}╣
+║  File: {{file:<55.54}}║
+╚{_BOX_H64}╝
+
+┌─ Validation Results {'─' * 43}┐
+"""
+_VALIDATION_REPORT_TAIL = f"""└{'─' * 64}┘
+
+┌─ Summary {'─' * 54}┐
+│ ✅ Passed: {{passed}}  │  ❌ Failed: {{failed}}  │  ⚠️ Warnings: {{warnings}}  │  Total: {{total}}
+└{'─' * 64}┘
+
+{{verdict}}"""
+
+
+def _read_for_rules(path: str) -> tuple[str | bytes, str | bytes]:
+    """
+    Read a test file for rule matching; return (content, case-folded content).
+
+    ASCII files stay bytes and are never decoded; anything else is decoded
+    as UTF-8 so IGNORECASE and \\s keep their Unicode semantics. Newlines
+    are translated the way read_text() would.
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    if b"\r" in content:
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if content.isascii():
+        return content, content.lower()
+    content = content.decode("utf-8")
+    return content, _fold_case(content)
+
+
 @mcp.tool()
 def validate_test_style(test_file_path: str) -> str:
     """
@@ -1048,14 +1871,12 @@ def validate_test_style(test_file_path: str) -> str:
     Returns:
         Validation results with pass/fail for each rule.
     """
-    project_root = get_project_root()
-    full_path = Path(project_root) / test_file_path
-
-    if not full_path.exists():
-        return f"Error: File not found: {test_file_path}"
+    full_path = os.path.join(_project_root_str(), test_file_path)
 
     try:
-        content = full_path.read_text(encoding="utf-8")
+        content, folded = _read_for_rules(full_path)
+    except FileNotFoundError:
+        return f"Error: File not found: {test_file_path}"
     except Exception as e:
         return f"Error reading file: {e}"
 
@@ -1063,77 +1884,78 @@ def validate_test_style(test_file_path: str) -> str:
     rules = config.get("validation_rules", [])
 
     rule_results = []
-    passed = 0
-    failed = 0
-    warnings = 0
+    counts = collections.Counter()
+    for status, rule in _evaluate_rules(rules, content, folded):
+        counts[status] += 1
+        if status == "SKIP":
+            label = _INVALID_FIELD_LABELS[rule.get("_invalid_field") or "pattern"]
+            detail = f"{label}: {rule.get('id', 'unknown')} ({rule.get('_compile_error')})"
+        else:
+            detail = rule.get("description", "")
+        rule_results.append(_RULE_RESULT_PREFIXES[status] + detail)
+    passed, failed, warnings = counts["PASS"], counts["FAIL"], counts["WARN"]
 
-    for rule in rules:
-        rule_id = rule.get("id", "unknown")
-        description = rule.get("description", "")
-        pattern = rule.get("pattern", "")
-        must_not_match = rule.get("must_not_match", False)
-        is_warning = rule.get("warning", False)
+    total = passed + failed + warnings
+    if failed == 0:
+        verdict = "🎉 Test file meets all required style rules!"
+    else:
+        verdict = f"⚠️ Please fix {failed} failed rule(s) before committing."
 
-        if not pattern:
-            continue
+    return (
+        _VALIDATION_REPORT_HEAD.format(file=test_file_path)
+        + "".join(f"{line}\n" for line in rule_results)
+        + _VALIDATION_REPORT_TAIL.format(
+            passed=passed, failed=failed, warnings=warnings, total=total, verdict=verdict,
+        )
+    )
 
-        try:
-            matches = bool(re.search(pattern, content, re.MULTILINE | re.IGNORECASE))
-
-            if must_not_match:
-                if matches:
-                    failed += 1
-                    rule_results.append(f"│ ❌ FAIL   {description}")
-                else:
-                    passed += 1
-                    rule_results.append(f"│ ✅ PASS   {description}")
-            else:
-                if matches:
-                    passed += 1
-                    rule_results.append(f"│ ✅ PASS   {description}")
-                else:
-                    if is_warning:
-                        warnings += 1
-                        rule_results.append(f"│ ⚠️  WARN   {description}")
-                    else:
-                        failed += 1
-                        rule_results.append(f"│ ❌ FAIL   {description}")
-        except re.error:
-            rule_results.append(f"│ ⚠️  SKIP   Invalid regex: {rule_id}")
-
-    # Build visual output
-    width = 64
-    h = "═"
-    results = []
 
-    # Header box
-    results.append(f"╔{h * width}╗")
-    results.append(f"║  🔍 TEST STYLE VALIDATION REPORT{' ' * (width - 34)}║")
-    results.append(f"╠{h * width}╣")
-    results.append(f"║  File: {test_file_path[:width-10]:<{width-9}}║")
-    results.append(f"╚{h * width}╝")
-    results.append("")
-
-    # Results section
-    results.append(f"┌─ Validation Results {'─' * (width - 21)}┐")
-    results.extend(rule_results)
-    results.append(f"└{'─' * width}┘")
-    results.append("")
-
-    # Summary section
-    total = passed + failed + warnings
-    status_icon = "🎉" if failed == 0 else "⚠️"
-    results.append(f"┌─ Summary {'─' * (width - 10)}┐")
-    results.append(f"│ ✅ Passed: {passed}  │  ❌ Failed: {failed}  │  ⚠️ Warnings: {warnings}  │  Total: {total}")
-    results.append(f"└{'─' * width}┘")
-    results.append("")
+# Starter .jest-helper.json written by init_style_config: a simplified
+# config for teams to customize, serialized once at import.
+_STARTER_CONFIG = {
+    "style_guide": {
+        "test_structure": "describe + it",
+        "it_naming": "should + verb",
+        "describe_naming": "component/function name",
+        "arrangement": "AAA (Arrange-Act-Assert) structure",
+        "comments": False,
+        "imports_order": ["react", "testing-library", "components", "utils", "mocks"],
+        "mock_location": "top of file after imports",
+        "assertions_per_test": "1-3 related assertions",
+        "edge_cases_required": ["null/undefined", "empty values", "error states"],
+        "custom_rules": [
+            "Always mock API calls",
+            "Use data-testid only as last resort"
+        ]
+    },
+    "validation_rules": [
+        {"id": "has_describe", "description": "Test must use describe() blocks", "pattern": "describe\\s*\\(", "flags": ["multiline"]},
+        {"id": "has_it_or_test", "description": "Test must use it() or test()", "pattern": "(it|test)\\s*\\(", "flags": ["multiline"]},
+        {"id": "it_uses_should", "description": "it() should start with 'should'", "pattern": "it\\s*\\(\\s*['\"]should", "warning": True},
+        {"id": "has_assertions", "description": "Test must have assertions", "pattern": "expect\\s*\\(", "flags": ["multiline"]},
+        {"id": "has_aaa_comments", "description": "Test should have AAA comments (optional)", "pattern": "//\\s*(Arrange|Act|Assert)", "warning": True},
+        {"id": "no_only", "description": "No .only() or .skip() in tests", "pattern": "\\.(only|skip)\\s*\\(", "flags": ["multiline"], "prefilter": [".only", ".skip"], "must_not_match": True}
+    ]
+}
+_STARTER_CONFIG_JSON = json.dumps(_STARTER_CONFIG, indent=2).encode("ascii")
 
-    if failed == 0:
-        results.append(f"{status_icon} Test file meets all required style rules!")
-    else:
-        results.append(f"{status_icon} Please fix {failed} failed rule(s) before committing.")
+_INIT_SUCCESS_TEMPLATE = f"""╔{_BOX_H60}╗
+║  ✅ Jest Helper Configuration Initialized                  ║
+╚{_BOX_H60}╝
 
-    return "\n".join(results)
+📁 Created: {{config_path}}
+
+┌─ What to Customize ────────────────────────────────────────┐
+│ • style_guide      → Naming conventions and structure      │
+│ • validation_rules → Add/modify rules (required/warning)   │
+│ • custom_rules     → Team-specific guidelines              │
+└────────────────────────────────────────────────────────────┘
+
+┌─ Next Steps ───────────────────────────────────────────────┐
+│ 1. Edit .jest-helper.json to match team preferences        │
+│ 2. Commit to repo so all devs share the same config        │
+│ 3. Claude will enforce these rules when writing tests      │
+└────────────────────────────────────────────────────────────┘"""
 
 
 @mcp.tool()
@@ -1147,62 +1969,120 @@ def init_style_config() -> str:
     Returns:
         Success message with the config file path.
     """
-    project_root = get_project_root()
-    config_path = Path(project_root) / ".jest-helper.json"
+    config_path = _project_root_path() / ".jest-helper.json"
 
-    if config_path.exists():
+    try:
+        # 'x' creates the file only if nothing is there yet, so there's no
+        # separate exists() check to race with
+        with open(config_path, 'xb') as f:
+            f.write(_STARTER_CONFIG_JSON)
+    except FileExistsError:
         return f"Config file already exists at: {config_path}\n\nEdit this file to customize your team's test standards."
+    except Exception as e:
+        return f"Error creating config file: {e}"
 
-    # Create a simplified config for users to customize
-    user_config = {
-        "style_guide": {
-            "test_structure": "describe + it",
-            "it_naming": "should + verb",
-            "describe_naming": "component/function name",
-            "arrangement": "AAA (Arrange-Act-Assert) structure",
-            "comments": False,
-            "imports_order": ["react", "testing-library", "components", "utils", "mocks"],
-            "mock_location": "top of file after imports",
-            "assertions_per_test": "1-3 related assertions",
-            "edge_cases_required": ["null/undefined", "empty values", "error states"],
-            "custom_rules": [
-                "Always mock API calls",
-                "Use data-testid only as last resort"
-            ]
-        },
-        "validation_rules": [
-            {"id": "has_describe", "description": "Test must use describe() blocks", "pattern": "describe\\s*\\("},
-            {"id": "has_it_or_test", "description": "Test must use it() or test()", "pattern": "(it|test)\\s*\\("},
-            {"id": "it_uses_should", "description": "it() should start with 'should'", "pattern": "it\\s*\\(\\s*['\"]should", "warning": True},
-            {"id": "has_assertions", "description": "Test must have assertions", "pattern": "expect\\s*\\("},
-            {"id": "has_aaa_comments", "description": "Test should have AAA comments (optional)", "pattern": "//\\s*(Arrange|Act|Assert)", "warning": True},
-            {"id": "no_only", "description": "No .only() or .skip() in tests", "pattern": "\\.(only|skip)\\s*\\(", "must_not_match": True}
-        ]
-    }
+    _CONFIG_MISSING.pop(str(config_path), None)
+    return _INIT_SUCCESS_TEMPLATE.format(config_path=config_path)
 
-    try:
-        with open(config_path, 'w') as f:
-            json.dump(user_config, f, indent=2)
 
-        return f"""╔{'═' * 60}╗
-║  ✅ Jest Helper Configuration Initialized                  ║
-╚{'═' * 60}╝
+# Files with more lines than this are cut down to their first describe block
+_EXAMPLE_FULL_LINES = 80
 
-📁 Created: {config_path}
 
-┌─ What to Customize ────────────────────────────────────────┐
-│ • style_guide      → Naming conventions and structure      │
-│ • validation_rules → Add/modify rules (required/warning)   │
-│ • custom_rules     → Team-specific guidelines              │
-└────────────────────────────────────────────────────────────┘
+def _split_lines(raw_lines: Iterator[str]) -> Iterator[str]:
+    """Yield file lines without terminators, exactly like str.split('\\n')."""
+    raw = "\n"
+    for raw in raw_lines:
+        yield raw.rstrip("\n")
+    if raw.endswith("\n"):
+        yield ""
+
+
+# Tokens that affect brace counting: escapes, comment delimiters, quotes, braces
+_RE_BRACE_TOKENS = re.compile(r"""\\.|//|/\*|\*/|[{}'"`]""")
 
-┌─ Next Steps ───────────────────────────────────────────────┐
-│ 1. Edit .jest-helper.json to match team preferences        │
-│ 2. Commit to repo so all devs share the same config        │
-│ 3. Claude will enforce these rules when writing tests      │
-└────────────────────────────────────────────────────────────┘"""
-    except Exception as e:
-        return f"Error creating config file: {e}"
+
+def _brace_delta(line: str, state: str | None) -> tuple[int, str | None]:
+    """
+    Net '{' minus '}' on one line, ignoring braces in strings and comments.
+
+    state is the token that closes a string or comment left open by the
+    previous line ("*/" or a backtick; quotes don't span lines), or None.
+
+    Returns:
+        tuple: (brace delta, state for the next line)
+    """
+    depth = 0
+    for match in _RE_BRACE_TOKENS.finditer(line):
+        token = match.group()
+        if state is not None:
+            if token == state:
+                state = None
+        elif token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+        elif token == "//":
+            break
+        elif token == "/*":
+            state = "*/"
+        elif token in ("'", '"', "`"):
+            state = token
+    if state in ("'", '"'):
+        state = None
+    return depth, state
+
+
+def _read_example_snippet(test_file: str) -> list[str]:
+    """
+    Read the example snippet for a test file, streaming it line by line.
+
+    Short files are returned whole; for longer ones only the first describe
+    block (capped at ~50 lines) is kept, and reading stops as soon as that
+    block is complete instead of loading the whole file.
+
+    Args:
+        test_file: Absolute path of the test file
+
+    Returns:
+        Snippet lines without line terminators.
+    """
+    with open(test_file, encoding="utf-8") as fh:
+        # Buffer the head of the file to decide which mode applies: the file
+        # is "long" once _EXAMPLE_FULL_LINES newline-terminated lines are seen
+        head = []
+        for line in fh:
+            head.append(line)
+            if len(head) == _EXAMPLE_FULL_LINES and line.endswith("\n"):
+                break
+        else:
+            return list(_split_lines(head))
+
+        # Find first describe and its content
+        in_describe = False
+        brace_count = 0
+        brace_state = None
+        snippet_lines = []
+
+        for line in _split_lines(itertools.chain(head, fh)):
+            # One cheap probe rules out almost every line before the exact checks
+            if not in_describe and 'describe' in line and ('describe(' in line or 'describe (' in line):
+                in_describe = True
+
+            if in_describe:
+                snippet_lines.append(line)
+                delta, brace_state = _brace_delta(line, brace_state)
+                brace_count += delta
+
+                if brace_count <= 0 and len(snippet_lines) > 5:
+                    break
+
+                if len(snippet_lines) > 50:
+                    snippet_lines.append("  // ... more tests ...")
+                    snippet_lines.append("});")
+                    break
+
+        return snippet_lines[:60]
 
 
 @mcp.tool()
@@ -1219,23 +2099,20 @@ def get_example_tests(count: int = 2) -> str:
     Returns:
         Real code examples showing the team's actual testing patterns.
     """
-    project_root = get_project_root()
+    project_root = _project_root_path()
 
-    # Find test files
-    test_patterns = ["**/*.test.tsx", "**/*.test.ts", "**/*.test.jsx", "**/*.test.js"]
-    test_files = []
-    for pattern in test_patterns:
-        test_files.extend(Path(project_root).glob(pattern))
+    if count <= 0:
+        return "No examples requested (count must be at least 1)."
 
-    test_files = [f for f in test_files if "node_modules" not in str(f)]
+    # Find test files in a single pruned walk and keep only the `count` most
+    # recently modified, without materializing the full file list
+    test_files = _iter_test_files(project_root, _DOT_TEST_SUFFIXES, skip_dirs=_EXAMPLE_SKIP_DIRS)
+    stamped = ((os.stat(path).st_mtime, relative, path) for relative, path in test_files)
+    sample = [(relative, path) for _, relative, path in heapq.nlargest(count, stamped)]
 
-    if not test_files:
+    if not sample:
         return "No existing test files found. Use get_test_template() instead for canonical examples."
 
-    # Get the most recently modified test files
-    test_files = sorted(test_files, key=lambda x: x.stat().st_mtime, reverse=True)
-    sample = test_files[:count]
-
     output = [
         "# 📚 REAL EXAMPLES FROM YOUR CODEBASE",
         "",
@@ -1243,45 +2120,14 @@ def get_example_tests(count: int = 2) -> str:
         "",
     ]
 
-    for test_file in sample:
+    for relative_path, test_file in sample:
         try:
-            content = test_file.read_text(encoding="utf-8")
-            relative_path = str(test_file.relative_to(project_root))
-
-            # Extract meaningful snippets
-            lines = content.split('\n')
+            snippet_lines = _read_example_snippet(test_file)
 
             output.append(f"## Example: `{relative_path}`")
             output.append("")
             output.append("```typescript")
-
-            # Try to extract just the first describe block if file is large
-            if len(lines) > 80:
-                # Find first describe and its content
-                in_describe = False
-                brace_count = 0
-                snippet_lines = []
-
-                for line in lines:
-                    if 'describe(' in line or 'describe (' in line:
-                        in_describe = True
-
-                    if in_describe:
-                        snippet_lines.append(line)
-                        brace_count += line.count('{') - line.count('}')
-
-                        if brace_count <= 0 and len(snippet_lines) > 5:
-                            break
-
-                        if len(snippet_lines) > 50:
-                            snippet_lines.append("  // ... more tests ...")
-                            snippet_lines.append("});")
-                            break
-
-                output.extend(snippet_lines[:60])
-            else:
-                output.extend(lines)
-
+            output.extend(snippet_lines)
             output.append("```")
             output.append("")
 
@@ -1312,53 +2158,40 @@ def rewrite_test_to_standard(test_file_path: str) -> str:
     Returns:
         A comprehensive report with the test, violations, and rewrite guidance.
     """
-    project_root = get_project_root()
-    full_path = Path(project_root) / test_file_path
+    full_path = os.path.join(_project_root_str(), test_file_path)
 
-    if not full_path.exists():
-        return f"Error: File not found: {test_file_path}"
-
-    # Read the current test
+    # Read the current test (plus a case-folded copy, shared by type
+    # detection and the validation rules). ASCII files stay bytes.
     try:
-        current_content = full_path.read_text(encoding="utf-8")
+        current_content, folded = _read_for_rules(full_path)
+    except FileNotFoundError:
+        return f"Error: File not found: {test_file_path}"
     except Exception as e:
         return f"Error reading file: {e}"
 
+    def has(text, token: str) -> bool:
+        return (token if isinstance(text, str) else token.encode()) in text
+
     # Detect test type based on content
     test_type = "utility_function"  # default
-    if "render(" in current_content or "screen." in current_content:
-        if "renderHook(" in current_content:
+    if has(current_content, "render(") or has(current_content, "screen."):
+        if has(current_content, "renderHook("):
             test_type = "hook"
         else:
             test_type = "react_component"
-    elif "mock" in current_content.lower() and ("api" in current_content.lower() or "fetch" in current_content.lower() or "http" in current_content.lower()):
+    elif has(folded, "mock") and (has(folded, "api") or has(folded, "fetch") or has(folded, "http")):
         test_type = "api_service"
 
     # Run validation
     config = load_config()
     rules = config.get("validation_rules", [])
-    style = config.get("style_guide", {})
-
-    issues = []
-    for rule in rules:
-        pattern = rule.get("pattern", "")
-        must_not_match = rule.get("must_not_match", False)
-        is_warning = rule.get("warning", False)
-        description = rule.get("description", "")
+    style = collections.ChainMap(config.get("style_guide", {}), _STYLE_GUIDE_DEFAULTS)
 
-        if not pattern:
-            continue
-
-        try:
-            matches = bool(re.search(pattern, current_content, re.MULTILINE | re.IGNORECASE))
-
-            if must_not_match and matches:
-                issues.append(f"❌ {description}")
-            elif not must_not_match and not matches:
-                prefix = "⚠️" if is_warning else "❌"
-                issues.append(f"{prefix} {description}")
-        except re.error:
-            pass
+    issues = [
+        _RULE_ISSUE_PREFIXES[status] + rule.get("description", "")
+        for status, rule in _evaluate_rules(rules, current_content, folded)
+        if status in _RULE_ISSUE_PREFIXES
+    ]
 
     # Get the appropriate template
     templates = config.get("templates", {})
@@ -1366,12 +2199,12 @@ def rewrite_test_to_standard(test_file_path: str) -> str:
 
     # Build the output
     output = [
-        f"╔{'═' * 64}╗",
+        f"╔{_BOX_H64}╗",
         f"║  🔄 TEST REWRITE ANALYSIS{' ' * 38}║",
-        f"╠{'═' * 64}╣",
-        f"║  File: {test_file_path[:55]:<55}║",
+        f"╠{_BOX_H64}╣",
+        f"║  File: {test_file_path:<55.55}║",
         f"║  Detected Type: {test_type:<47}║",
-        f"╚{'═' * 64}╝",
+        f"╚{_BOX_H64}╝",
         "",
     ]
 
@@ -1389,21 +2222,34 @@ def rewrite_test_to_standard(test_file_path: str) -> str:
 
     # Style guide summary
     output.append("┌─ Required Style ──────────────────────────────────────────┐")
-    output.append(f"│ Structure    : {style.get('test_structure', 'describe + it'):<48}│")
-    output.append(f"│ it() naming  : {style.get('it_naming', 'should + verb'):<48}│")
-    output.append(f"│ Arrangement  : {style.get('arrangement', 'AAA structure'):<48}│")
+    output.append(f"│ Structure    : {style['test_structure']:<48}│")
+    output.append(f"│ it() naming  : {style['it_naming']:<48}│")
+    output.append(f"│ Arrangement  : {style['arrangement']:<48}│")
     output.append("└────────────────────────────────────────────────────────────┘")
     output.append("")
 
     # Current test content
     output.append("┌─ Current Test Content ─────────────────────────────────────┐")
     output.append("```typescript")
-    # Truncate if too long
-    lines = current_content.split('\n')
-    if len(lines) > 60:
-        output.extend(lines[:30])
-        output.append(f"\n// ... [{len(lines) - 60} lines omitted] ...\n")
-        output.extend(lines[-30:])
+    # Truncate if too long: the 30 head/tail lines are sliced out at their
+    # newline offsets instead of splitting the whole file into lines
+    newline = "\n" if isinstance(current_content, str) else b"\n"
+    total_lines = current_content.count(newline) + 1
+    if total_lines > 60:
+        head_end = -1
+        for _ in range(30):
+            head_end = current_content.find(newline, head_end + 1)
+        tail_start = len(current_content)
+        for _ in range(30):
+            tail_start = current_content.rfind(newline, 0, tail_start)
+        head, tail = current_content[:head_end], current_content[tail_start + 1:]
+        if newline == b"\n":
+            head, tail = head.decode("ascii"), tail.decode("ascii")
+        output.append(head)
+        output.append(f"\n// ... [{total_lines - 60} lines omitted] ...\n")
+        output.append(tail)
+    elif newline == b"\n":
+        output.append(current_content.decode("ascii"))
     else:
         output.append(current_content)
     output.append("```")
@@ -1435,7 +2281,6 @@ def rewrite_test_to_standard(test_file_path: str) -> str:
 # RUN THE SERVER
 # ============================================================
 if __name__ == "__main__":
-    import sys
     print("🚀 Jest Helper MCP Server starting...", file=sys.stderr)
     print(f"📁 Project root: {get_project_root()}", file=sys.stderr)
     print("✅ Ready to accept connections", file=sys.stderr)